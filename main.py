@@ -1,13 +1,53 @@
 import pygame
 import sys
+import os
 import time
 import random
+from pathlib import Path
+
+# Common Chinese fonts - Windows paths first
+CHINESE_FONTS = [
+    'C:/Windows/Fonts/msyh.ttc',     # Microsoft YaHei
+    'C:/Windows/Fonts/simhei.ttf',   # SimHei
+    'C:/Windows/Fonts/simsun.ttc',   # SimSun
+    'C:/Windows/Fonts/msyhbd.ttc',   # Microsoft YaHei Bold
+    '/usr/share/fonts/truetype/droid/DroidSansFallbackFull.ttf',
+    '/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc',
+    '/usr/share/fonts/truetype/wqy/wqy-zenhei.ttc',
+]
+
+# Loaded fonts, keyed by (path, size), shared by all paradigm instances;
+# the default font is stored under path None
+_FONT_CACHE = {}
+
+def _load_chinese_font(size):
+    """Load the first available Chinese font at the given size (cached per path and size)."""
+    for font_path in CHINESE_FONTS:
+        if not os.path.exists(font_path):
+            continue
+        font_id = (font_path, size)
+        if font_id in _FONT_CACHE:
+            return _FONT_CACHE[font_id]
+        try:
+            font = pygame.font.Font(font_path, size)
+        except (OSError, pygame.error):
+            continue
+        print(f"Successfully loaded font: {font_path}")
+        _FONT_CACHE[font_id] = font
+        return font
+    
+    font_id = (None, size)
+    if font_id not in _FONT_CACHE:
+        print("Warning: Could not load Chinese font. Using default font.")
+        _FONT_CACHE[font_id] = pygame.font.Font(None, size)
+    return _FONT_CACHE[font_id]
 
 class SentenceParadigm:
     def __init__(self, sentences_file, char_speed=1.2, 
                  prep_time=1.5, prep_time_jitter=0.1, jitter_mean=0.5, jitter_std=0.1, prep_mode='square', 
                  dot_interval=0.5, play_mode='green', 
-                 progress_duration=1.2, progress_pause=0.5, inter_sentence_interval=2.0):
+                 progress_duration=1.2, progress_pause=0.5, inter_sentence_interval=2.0,
+                 seed=None):
         """
         Initialize the sentence paradigm display.
         
@@ -42,7 +82,22 @@ class SentenceParadigm:
         progress_pause : float
             Pause duration between characters in progress mode (seconds)
             Only used when play_mode='progress'
+        inter_sentence_interval : float
+            Total inter-sentence interval (seconds)
+        seed : int or None
+            Seed for the prep_time and character jitter schedule (None for random)
         """
+        # Phase implementations, chosen once for the configured modes. Checked
+        # before pygame starts, so a bad mode never leaves a fullscreen window open
+        prep_phases = {'square': self._prep_square, 'dots': self._prep_dots}
+        play_phases = {'green': self._play_green, 'progress': self._play_progress}
+        if prep_mode not in prep_phases:
+            raise ValueError(f"Unknown prep_mode: {prep_mode!r} (expected 'square' or 'dots')")
+        if play_mode not in play_phases:
+            raise ValueError(f"Unknown play_mode: {play_mode!r} (expected 'green' or 'progress')")
+        self._prep = prep_phases[prep_mode]
+        self._play = play_phases[play_mode]
+        
         self.sentences_file = sentences_file
         self.char_speed = char_speed  # seconds per character
         self.prep_time = prep_time    # seconds (center value)
@@ -56,17 +111,48 @@ class SentenceParadigm:
         self.inter_sentence_interval = inter_sentence_interval # total inter-sentence interval in seconds
         
         # Load sentences
-        with open(sentences_file, 'r', encoding='utf-8') as f:
-            self.sentences = [line.strip() for line in f if line.strip()]
+        raw = Path(sentences_file).read_text(encoding='utf-8')
+        self.sentences = [s for s in map(str.strip, raw.splitlines()) if s]
+        
+        # Sample the whole jitter schedule up front so a seed reproduces a session
+        self.seed = seed
+        rng = random.Random(seed)
+        self._prep_times = [rng.uniform(prep_time - prep_time_jitter, prep_time + prep_time_jitter)
+                            for _ in self.sentences]
+        self._char_jitters = [rng.uniform(jitter_mean - jitter_std, jitter_mean + jitter_std)
+                              for _ in self.sentences]
         
         # Initialize pygame
         pygame.init()
         
-        # Set up display (fullscreen)
-        self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+        # Set up display (fullscreen). SCALED presents the frame through SDL2's
+        # GPU renderer as a texture; it needs an explicit size, so use the desktop's.
+        # vsync lets each presented frame wait for the display refresh.
+        info = pygame.display.Info()
+        size = (info.current_w, info.current_h)
+        try:
+            self.screen = pygame.display.set_mode(size, pygame.FULLSCREEN | pygame.SCALED, vsync=1)
+            self.vsync = True
+        except pygame.error:
+            print("Warning: vsync not available. Falling back to unsynchronized display.")
+            self.screen = pygame.display.set_mode(size, pygame.FULLSCREEN | pygame.SCALED)
+            self.vsync = False
+        # SDL can also ignore the vsync hint silently; ask where pygame can tell
+        is_vsync = getattr(pygame.display, 'is_vsync', None)
+        if is_vsync is not None:
+            self.vsync = bool(is_vsync())
         self.width, self.height = self.screen.get_size()
         pygame.display.set_caption("Sentence Paradigm")
         
+        # Frame cap for animations when presents are not paced by vsync
+        self.clock = pygame.time.Clock()
+        
+        # Only queue the events we react to; fullscreen drivers can flood the
+        # queue with mouse motion otherwise
+        self._watched = (pygame.QUIT, pygame.KEYDOWN)
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(self._watched)
+        
         # Colors
         self.BLACK = (0, 0, 0)
         self.WHITE = (255, 255, 255)
@@ -77,37 +163,7 @@ class SentenceParadigm:
         # Font settings (larger for Chinese characters)
         self.font_size = 80
         self.char_spacing = 15  # Space between characters
-        self.font = pygame.font.Font(None, self.font_size)
-        
-        # Try to load a Chinese font
-        try:
-            # Common Chinese fonts - Windows paths first
-            chinese_fonts = [
-                'C:/Windows/Fonts/msyh.ttc',     # Microsoft YaHei
-                'C:/Windows/Fonts/simhei.ttf',   # SimHei
-                'C:/Windows/Fonts/simsun.ttc',   # SimSun
-                'C:/Windows/Fonts/msyhbd.ttc',   # Microsoft YaHei Bold
-                '/usr/share/fonts/truetype/droid/DroidSansFallbackFull.ttf',
-                '/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc',
-                '/usr/share/fonts/truetype/wqy/wqy-zenhei.ttc',
-            ]
-            
-            font_loaded = False
-            for font_path in chinese_fonts:
-                try:
-                    self.font = pygame.font.Font(font_path, self.font_size)
-                    print(f"Successfully loaded font: {font_path}")
-                    font_loaded = True
-                    break
-                except Exception as e:
-                    continue
-            
-            if not font_loaded:
-                print("Warning: Could not load Chinese font. Using default font.")
-                self.font = pygame.font.Font(None, self.font_size)
-        except:
-            print("Warning: Could not load Chinese font. Using default font.")
-            self.font = pygame.font.Font(None, self.font_size)
+        self.font = _load_chinese_font(self.font_size)
         
         # Square settings
         self.square_size = 40
@@ -120,18 +176,86 @@ class SentenceParadigm:
         # Progress bar settings
         self.progress_bar_height = 8  # Height of progress bar
         
-        # Clock for timing
-        self.clock = pygame.time.Clock()
+        # Fixation cross settings
+        self.cross_size = 40  # Size of cross arms
+        self.cross_thickness = 10  # Thickness of cross lines
+        
+        # Rendered glyph cache, keyed by (char, color)
+        self._glyph_cache = {}
+        
+        # Pre-rendered squares and fixation cross, blitted instead of drawn every frame
+        self._red_square = pygame.Surface((self.square_size, self.square_size))
+        self._red_square.fill(self.RED)
+        self._red_square = self._red_square.convert()
+        self._green_square = pygame.Surface((self.square_size, self.square_size))
+        self._green_square.fill(self.GREEN)
+        self._green_square = self._green_square.convert()
+        
+        self._cross = pygame.Surface((self.cross_size * 2, self.cross_size * 2))
+        self._cross.fill(self.BLACK)
+        pygame.draw.rect(self._cross, self.WHITE,
+                         (0, self.cross_size - self.cross_thickness // 2,
+                          self.cross_size * 2, self.cross_thickness))  # Horizontal line
+        pygame.draw.rect(self._cross, self.WHITE,
+                         (self.cross_size - self.cross_thickness // 2, 0,
+                          self.cross_thickness, self.cross_size * 2))  # Vertical line
+        self._cross = self._cross.convert()
+        
+    def render_glyph(self, char, color):
+        """Return the rendered Surface for a character, rendering it only once."""
+        key = (char, color)
+        surf = self._glyph_cache.get(key)
+        if surf is None:
+            # Convert once to the display format so per-frame blits skip conversion
+            surf = self.font.render(char, True, color).convert_alpha(self.screen)
+            self._glyph_cache[key] = surf
+        return surf
+        
+    def check_exit_events(self):
+        """Check for exit events (QUIT, ESC). Returns False if the user asked to quit."""
+        for event in pygame.event.get(self._watched):
+            if event.type == pygame.QUIT or event.key == pygame.K_ESCAPE:
+                return False
+        return True
+        
+    def wait(self, duration):
+        """Keep the current frame on screen for duration seconds, polling events
+        without redrawing. Returns False if the user asked to quit."""
+        deadline = time.perf_counter() + duration
+        while True:
+            if not self.check_exit_events():
+                return False
+            
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            # Coarse sleep while far from the deadline, then yield-spin for the
+            # last couple of milliseconds so the phase ends on time
+            if remaining > 0.002:
+                time.sleep(min(0.005, remaining - 0.002))
+            else:
+                time.sleep(0)
+        return True
         
     def draw_red_square(self, sentence_y):
         """Draw red square below the sentence."""
         square_x = self.width // 2 - self.square_size // 2
         square_y = sentence_y + 120  # Increased from 60 to 120
-        pygame.draw.rect(self.screen, self.RED, 
-                        (square_x, square_y, self.square_size, self.square_size))
+        self.screen.blit(self._red_square, (square_x, square_y))
     
-    def draw_dots(self, sentence_y, char_widths, num_dots_left, num_dots_right):
-        """Draw dots on both sides of the sentence."""
+    def draw_green_square(self, sentence_y):
+        """Draw green square below the sentence."""
+        square_x = self.width // 2 - self.square_size // 2
+        square_y = sentence_y + 120
+        self.screen.blit(self._green_square, (square_x, square_y))
+    
+    def draw_fixation_cross(self):
+        """Draw white fixation cross in center of screen."""
+        self.screen.blit(self._cross, (self.width // 2 - self.cross_size,
+                                       self.height // 2 - self.cross_size))
+    
+    def dot_positions(self, sentence_y, char_widths, num_dots):
+        """Return the (x, y) centers of num_dots dots on the left and right of the sentence."""
         # Calculate sentence boundaries
         total_width = sum(char_widths) + self.char_spacing * (len(char_widths) - 1)
         sentence_left = (self.width - total_width) // 2
@@ -140,244 +264,298 @@ class SentenceParadigm:
         # Add font_size // 2 to get to the vertical center of the text
         dot_y = sentence_y + 35 # 35 is fine-tuned for vertical alignment
         
-        # Draw left dots
-        for i in range(num_dots_left):
-            dot_x = sentence_left - self.dot_spacing - (i * (self.dot_radius * 2 + self.dot_spacing))
-            pygame.draw.circle(self.screen, self.WHITE, (dot_x, dot_y), self.dot_radius)
+        step = self.dot_radius * 2 + self.dot_spacing
+        left_positions = [(sentence_left - self.dot_spacing - i * step, dot_y) for i in range(num_dots)]
+        right_positions = [(sentence_right + self.dot_spacing + i * step, dot_y) for i in range(num_dots)]
+        return left_positions, right_positions
+    
+    def draw_dots(self, left_positions, right_positions, num_dots_left, num_dots_right):
+        """Draw the innermost num_dots_left/num_dots_right dots on both sides of the sentence."""
+        # Lock once for the whole group of draws instead of once per circle
+        self.screen.lock()
+        try:
+            for pos in left_positions[:num_dots_left]:
+                pygame.draw.circle(self.screen, self.WHITE, pos, self.dot_radius)
+            for pos in right_positions[:num_dots_right]:
+                pygame.draw.circle(self.screen, self.WHITE, pos, self.dot_radius)
+        finally:
+            self.screen.unlock()
+    
+    def dots_rects(self, sentence_y, char_widths, num_dots):
+        """Return the left and right screen regions covered by num_dots dots on each side."""
+        total_width = sum(char_widths) + self.char_spacing * (len(char_widths) - 1)
+        sentence_left = (self.width - total_width) // 2
+        sentence_right = sentence_left + total_width
+        dot_y = sentence_y + 35
+        
+        step = self.dot_radius * 2 + self.dot_spacing
+        span = (num_dots - 1) * step + self.dot_radius * 2 + 1
+        left_x = sentence_left - self.dot_spacing - (num_dots - 1) * step - self.dot_radius
+        right_x = sentence_right + self.dot_spacing - self.dot_radius
+        return [pygame.Rect(left_x, dot_y - self.dot_radius, span, self.dot_radius * 2 + 1),
+                pygame.Rect(right_x, dot_y - self.dot_radius, span, self.dot_radius * 2 + 1)]
         
-        # Draw right dots
-        for i in range(num_dots_right):
-            dot_x = sentence_right + self.dot_spacing + (i * (self.dot_radius * 2 + self.dot_spacing))
-            pygame.draw.circle(self.screen, self.WHITE, (dot_x, dot_y), self.dot_radius)
+    def layout_sentence(self, sentence):
+        """Render and lay out a sentence once; returns the state shared by all phases."""
+        # Render the sentence to get position
+        sentence_y = self.height // 2 - 40
+        chars = list(sentence)
+        white_surfs = [self.render_glyph(char, self.WHITE) for char in chars]
+        green_surfs = [self.render_glyph(char, self.GREEN) for char in chars]
+        char_widths = [surf.get_width() for surf in white_surfs]
+        
+        # Compose the static white sentence once for the preparation phase
+        total_width = sum(char_widths) + self.char_spacing * (len(chars) - 1)
+        sentence_surf = pygame.Surface((total_width, self.font.get_height()), pygame.SRCALPHA)
+        current_x = 0
+        for i, char_surface in enumerate(white_surfs):
+            sentence_surf.blit(char_surface, (current_x, 0))
+            current_x += char_widths[i] + self.char_spacing
+        sentence_surf = sentence_surf.convert_alpha(self.screen)
+        start_x = (self.width - total_width) // 2
+        
+        # Screen x position and rect of each character (parallel to chars)
+        char_xs = []
+        current_x = start_x
+        for char_width in char_widths:
+            char_xs.append(current_x)
+            current_x += char_width + self.char_spacing
+        char_rects = [surf.get_rect(topleft=(x, sentence_y - 20)) for surf, x in zip(white_surfs, char_xs)]
+        
+        # In green mode only len(chars) + 1 text states exist, so bake each one
+        # (first k characters green, the rest white) into an opaque strip
+        strips = []
+        if self.play_mode == 'green':
+            for k in range(len(chars) + 1):
+                strip = pygame.Surface(sentence_surf.get_size()).convert()
+                strip.fill(self.BLACK)
+                strip.blits([(green_surfs[i] if i < k else white_surfs[i], (char_xs[i] - start_x, 0))
+                             for i in range(len(chars))], doreturn=False)
+                strips.append(strip)
+        
+        return {
+            'sentence_y': sentence_y,
+            'chars': chars,
+            'white_surfs': white_surfs,
+            'char_widths': char_widths,
+            'sentence_surf': sentence_surf,
+            'sentence_rect': sentence_surf.get_rect(topleft=(start_x, sentence_y - 20)),
+            'char_xs': char_xs,
+            'char_rects': char_rects,
+            'strips': strips,
+        }
+    
+    def draw_sentence_frame(self, layout):
+        """Clear the screen and draw the white sentence (not presented)."""
+        self.screen.fill(self.BLACK)
+        self.screen.blit(layout['sentence_surf'], layout['sentence_rect'])
         
-    def display_sentence(self, sentence):
+    def display_sentence(self, sentence, idx):
         """
         Display a single sentence with the paradigm:
         1. Preparation phase (square or dots mode)
         2. Characters turn green one by one at char_speed
         """
-        # Calculate timing
-        time_per_char = self.char_speed  # seconds per character
-        
-        # Render the sentence to get position
-        sentence_y = self.height // 2 - 40
-        chars = list(sentence)
-        char_widths = [self.font.render(char, True, self.WHITE).get_width() for char in chars]
+        layout = self.layout_sentence(sentence)
         
         # Phase 1: prepareration phase
-        if self.prep_mode == 'square':
-            # Sample prep_time from uniform distribution
-            actual_prep_time = random.uniform(self.prep_time - self.prep_time_jitter,
-                                              self.prep_time + self.prep_time_jitter)
-            
-            # Phase 1: Preparation phase (white sentence + red square)
-            start_time = time.time()
-            while time.time() - start_time < actual_prep_time:
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        return False
-                    if event.type == pygame.KEYDOWN:
-                        if event.key == pygame.K_ESCAPE:
-                            return False
-                
-                # Clear screen
-                self.screen.fill(self.BLACK)
-                
-                # Calculate starting x position for centered text with spacing
-                total_width = sum(char_widths) + self.char_spacing * (len(chars) - 1)
-                start_x = (self.width - total_width) // 2
-                
-                # Draw white sentence with spacing
-                current_x = start_x
-                for i, char in enumerate(chars):
-                    char_surface = self.font.render(char, True, self.WHITE)
-                    self.screen.blit(char_surface, (current_x, sentence_y - 20))
-                    current_x += char_widths[i] + self.char_spacing
-                
-                # Draw red square
-                self.draw_red_square(sentence_y) # Draw red square
-                
-                pygame.display.flip() # Update display
-                self.clock.tick(60) # Limit to 60 FPS
-        
-        elif self.prep_mode == 'dots':
-            # Phase 1: Dots disappearing phase
-            total_dots = 3
-            dots_left = total_dots
-            dots_right = total_dots
+        if not self._prep(layout, idx):
+            return False
+        
+        # Phase 2: Character display animation
+        if not self._play(layout, idx):
+            return False
+        
+        # Hold final state for 0.5 seconds
+        if not self.wait(0.5):
+            return False
+        
+        return True
+    
+    def _prep_square(self, layout, idx):
+        """Preparation phase: white sentence + red square for the sampled prep_time."""
+        # prep_time pre-sampled from uniform distribution
+        actual_prep_time = self._prep_times[idx]
+        
+        # The frame is static, so draw it once and only poll events afterwards
+        self.draw_sentence_frame(layout)
+        self.draw_red_square(layout['sentence_y']) # Draw red square
+        pygame.display.flip() # Update display
+        
+        return self.wait(actual_prep_time)
+    
+    def _prep_dots(self, layout, idx):
+        """Preparation phase: dots on both sides disappear one pair at a time."""
+        sentence_y = layout['sentence_y']
+        char_widths = layout['char_widths']
+        total_dots = 3
+        dots_left = total_dots
+        dots_right = total_dots
+        
+        # Draw the full frame once; afterwards only the dot regions are refreshed
+        self.draw_sentence_frame(layout)
+        left_positions, right_positions = self.dot_positions(sentence_y, char_widths, total_dots)
+        self.draw_dots(left_positions, right_positions, dots_left, dots_right)
+        pygame.display.flip()
+        dot_rects = self.dots_rects(sentence_y, char_widths, total_dots)
+        
+        start_time = time.perf_counter()
+        last_dot_time = start_time
+        
+        while dots_left > 0 or dots_right > 0:
+            if not self.check_exit_events():
+                return False
             
-            start_time = time.time()
-            last_dot_time = start_time
+            # Check if it's time to remove a dot
+            current_time = time.perf_counter()
+            elapsed_since_last = current_time - last_dot_time
             
-            while dots_left > 0 or dots_right > 0:
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        return False
-                    if event.type == pygame.KEYDOWN:
-                        if event.key == pygame.K_ESCAPE:
-                            return False
-                
-                # Check if it's time to remove a dot
-                current_time = time.time()
-                elapsed_since_last = current_time - last_dot_time
-                
-                if elapsed_since_last >= self.dot_interval:
-                    # Remove dots simultaneously from both sides
-                    if dots_left > 0:
-                        dots_left -= 1
-                    if dots_right > 0:
-                        dots_right -= 1
-                    last_dot_time = current_time
-                
-                # Clear screen
-                self.screen.fill(self.BLACK)
-                
-                # Calculate starting x position for centered text with spacing
-                total_width = sum(char_widths) + self.char_spacing * (len(chars) - 1)
-                start_x = (self.width - total_width) // 2
-                
-                # Draw white sentence with spacing
-                current_x = start_x
-                for i, char in enumerate(chars):
-                    char_surface = self.font.render(char, True, self.WHITE)
-                    self.screen.blit(char_surface, (current_x, sentence_y - 20))
-                    current_x += char_widths[i] + self.char_spacing
+            if elapsed_since_last >= self.dot_interval:
+                # Remove dots simultaneously from both sides
+                if dots_left > 0:
+                    dots_left -= 1
+                if dots_right > 0:
+                    dots_right -= 1
+                last_dot_time = current_time
                 
-                # Draw remaining dots
-                self.draw_dots(sentence_y, char_widths, dots_left, dots_right) # Draw dots
-                
-                pygame.display.flip() # Update display
-                self.clock.tick(60) # Limit to 60 FPS
+                # Erase the dot regions and draw the remaining dots
+                for rect in dot_rects:
+                    self.screen.fill(self.BLACK, rect)
+                self.draw_dots(left_positions, right_positions, dots_left, dots_right) # Draw dots
+                pygame.display.update(dot_rects) # Update only the dot regions
+            
+            time.sleep(0.001) # Nothing is presented between dot changes
         
-        # Phase 2: Character display animation
-        if self.play_mode == 'green':
-            # Original mode: Characters turn green one by one
-            green_count = 0
-            start_time = time.time()
+        return True
+    
+    def _play_green(self, layout, idx):
+        """Play phase: characters turn green one by one at char_speed."""
+        strips = layout['strips']
+        strip_rect = layout['sentence_rect']
+        green_count = 0
+        start_time = time.perf_counter()
+        
+        # Jitter pre-sampled from uniform distribution
+        jitter = self._char_jitters[idx]
+        
+        # Draw the all-white frame once; afterwards only the sentence strip is refreshed
+        self.draw_sentence_frame(layout)
+        
+        # Draw green square only in square mode
+        if self.prep_mode == 'square':
+            self.draw_green_square(layout['sentence_y'])
+        
+        pygame.display.flip()
+        drawn_count = 0
+        
+        # Bind loop invariants to locals to keep the per-frame body lean
+        n_chars = len(layout['chars'])
+        char_speed = self.char_speed
+        now = time.perf_counter
+        
+        while green_count <= n_chars:
+            if not self.check_exit_events():
+                return False
             
-            # Sample jitter from uniform distribution
-            jitter = random.uniform(self.jitter_mean - self.jitter_std, 
-                                    self.jitter_mean + self.jitter_std)
+            # Update green_count based on elapsed time
+            elapsed = now() - start_time
+            # First char turns green after jitter time
+            if elapsed < jitter:
+                green_count = 0
+            else:
+                green_count = int((elapsed - jitter) / char_speed) + 1
             
-            while green_count <= len(chars):
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        return False
-                    if event.type == pygame.KEYDOWN:
-                        if event.key == pygame.K_ESCAPE:
-                            return False
-                
-                # Update green_count based on elapsed time
-                elapsed = time.time() - start_time
-                # First char turns green after jitter time
-                if elapsed < jitter:
-                    green_count = 0
-                else:
-                    green_count = int((elapsed - jitter) / self.char_speed) + 1
-                
-                if green_count > len(chars):
-                    green_count = len(chars)
+            if green_count > n_chars:
+                green_count = n_chars
+            
+            # Redraw the sentence strip only when green_count advances
+            if green_count > drawn_count:
+                self.screen.blit(strips[green_count], strip_rect)
+                pygame.display.update(strip_rect)
+                drawn_count = green_count
+            
+            time.sleep(0.001) # Nothing is presented between transitions
+            
+            if green_count >= n_chars:
+                break
+        
+        return True
+    
+    def _play_progress(self, layout, idx):
+        """Play phase: a progress bar fills behind each character in turn."""
+        sentence_y = layout['sentence_y']
+        char_xs = layout['char_xs']
+        char_widths = layout['char_widths']
+        
+        # Only the text band changes while the bars grow, so the rest of the
+        # frame is drawn once and the band alone is refreshed per frame
+        progress_bar_y = sentence_y - 20 # fine-tuned for vertical alignment
+        band_rect = pygame.Rect(0, progress_bar_y, self.width,
+                                max(int(self.font_size * 1.4), self.font.get_height()))
+        
+        self.draw_sentence_frame(layout)
+        
+        # Draw green square in square mode
+        if self.prep_mode == 'square':
+            self.draw_green_square(sentence_y)
+        
+        pygame.display.flip()
+        
+        # Glyph blits are the same every frame; build the sequence once
+        text_blits = list(zip(layout['white_surfs'], layout['char_rects']))
+        
+        # Completed progress bars are painted once into a band-sized overlay
+        # (black background included), which also clears the band each frame
+        bar_height = int(self.font_size * 1.4)
+        bars_surf = pygame.Surface(band_rect.size).convert()
+        bars_surf.fill(self.BLACK)
+        
+        n_chars = len(layout['chars'])
+        for char_idx in range(n_chars):
+            # Calculate current character position
+            char_x = char_xs[char_idx]
+            char_width = char_widths[char_idx]
+            
+            # Progress bar animation for this character
+            start_time = time.perf_counter()
+            drawn_width = -1
+            while time.perf_counter() - start_time < self.progress_duration:
+                if not self.check_exit_events():
+                    return False
                 
-                # Clear screen
-                self.screen.fill(self.BLACK)
+                # Calculate progress
+                elapsed = time.perf_counter() - start_time
+                progress = min(1.0, elapsed / self.progress_duration)
+                progress_bar_width = int(char_width * 1.0 * progress) # change 1.0 to adjust width scaling
                 
-                # Calculate starting x position for centered text
-                total_width = sum(char_widths) + self.char_spacing * (len(chars) - 1)
-                start_x = (self.width - total_width) // 2
+                # Present only when the bar has actually grown
+                if progress_bar_width == drawn_width:
+                    time.sleep(0.001) # Nothing to present this iteration
+                    continue
+                drawn_width = progress_bar_width
                 
-                # Draw each character with spacing
-                current_x = start_x
-                for i, char in enumerate(chars):
-                    color = self.GREEN if i < green_count else self.WHITE
-                    char_surface = self.font.render(char, True, color)
-                    self.screen.blit(char_surface, (current_x, sentence_y - 20))
-                    current_x += char_widths[i] + self.char_spacing
+                # Clear the text band and draw completed progress bars (bottom layer)
+                self.screen.blit(bars_surf, band_rect)
                 
-                # Draw green square only in square mode
-                if self.prep_mode == 'square':
-                    square_x = self.width // 2 - self.square_size // 2
-                    square_y = sentence_y + 120
-                    pygame.draw.rect(self.screen, self.GREEN, 
-                                   (square_x, square_y, self.square_size, self.square_size))
+                # Draw current progress bar (bottom layer)
+                pygame.draw.rect(self.screen, self.LIGHT_BROWN,
+                               (char_x, progress_bar_y, progress_bar_width, bar_height))
                 
-                pygame.display.flip()
-                self.clock.tick(60)
+                # Draw all characters on top (top layer) in one batched call
+                self.screen.blits(text_blits, doreturn=False)
                 
-                if green_count >= len(chars):
-                    break
-        
-        elif self.play_mode == 'progress':
-                    
-            # New mode: Progress bar for each character
-            total_width = sum(char_widths) + self.char_spacing * (len(chars) - 1)
-            start_x = (self.width - total_width) // 2
+                pygame.display.update(band_rect) # Paced by vsync when it was granted
+                if not self.vsync:
+                    self.clock.tick_busy_loop(60)
             
-            # Track completed progress bars
-            completed_bars = []
+            # Add completed progress bar to the overlay
+            pygame.draw.rect(bars_surf, self.LIGHT_BROWN,
+                             (char_x, 0, int(char_width * 0.99), bar_height))
             
-            for char_idx in range(len(chars)):
-                # Calculate current character position
-                char_x = start_x + sum(char_widths[:char_idx]) + self.char_spacing * char_idx
-                char_width = char_widths[char_idx]
-                
-                # Progress bar animation for this character
-                start_time = time.time()
-                while time.time() - start_time < self.progress_duration:
-                    for event in pygame.event.get():
-                        if event.type == pygame.QUIT:
-                            return False
-                        if event.type == pygame.KEYDOWN:
-                            if event.key == pygame.K_ESCAPE:
-                                return False
-                    
-                    # Calculate progress
-                    elapsed = time.time() - start_time
-                    progress = min(1.0, elapsed / self.progress_duration)
-                    
-                    # Clear screen
-                    self.screen.fill(self.BLACK)
-
-                    # position
-                    progress_bar_y_temp = sentence_y - 20 # fine-tuned for vertical alignment
-                    
-                    # Draw completed progress bars first (bottom layer)
-                    for completed_idx, completed_x, completed_width in completed_bars:
-                        progress_bar_y = progress_bar_y_temp
-                        pygame.draw.rect(self.screen, self.LIGHT_BROWN,
-                                       (completed_x, progress_bar_y, completed_width, int(self.font_size * 1.4)))
-                    
-                    # Draw current progress bar (bottom layer)
-                    progress_bar_y = progress_bar_y_temp
-                    progress_bar_width = int(char_width * 1.0 * progress) # change 1.0 to adjust width scaling
-                    pygame.draw.rect(self.screen, self.LIGHT_BROWN,
-                                   (char_x, progress_bar_y, progress_bar_width, int(self.font_size * 1.4)))
-                    
-                    # Draw all characters on top (top layer)
-                    current_x = start_x
-                    for i, char in enumerate(chars):
-                        char_surface = self.font.render(char, True, self.WHITE)
-                        self.screen.blit(char_surface, (current_x, sentence_y - 20))
-                        current_x += char_widths[i] + self.char_spacing
-
-                    # Draw green square in square mode (add this)
-                    if self.prep_mode == 'square':
-                        square_x = self.width // 2 - self.square_size // 2
-                        square_y = sentence_y + 120
-                        pygame.draw.rect(self.screen, self.GREEN, 
-                                    (square_x, square_y, self.square_size, self.square_size))
-                    
-                    pygame.display.flip()
-                    self.clock.tick(60)
-                
-                # Add completed progress bar to the list
-                completed_bars.append((char_idx, char_x, int(char_width * 0.99)))
-                
-                # Pause between characters (except after last character)
-                if char_idx < len(chars) - 1:
-                    time.sleep(self.progress_pause)
-        
-        # Hold final state for 0.5 seconds
-        time.sleep(0.5)
+            # Pause between characters (except after last character)
+            if char_idx < n_chars - 1:
+                if not self.wait(self.progress_pause):
+                    return False
         
         return True
         
@@ -392,49 +570,25 @@ class SentenceParadigm:
             for i, sentence in enumerate(self.sentences):
                 print(f"Displaying sentence {i+1}/{len(self.sentences)}: {sentence}")
                 
-                if not self.display_sentence(sentence):
+                if not self.display_sentence(sentence, i):
                     break
                 
                 # Inter-sentence interval with black screen then white cross
                 # First 0.5s: black screen
                 self.screen.fill(self.BLACK)
                 pygame.display.flip()
-                time.sleep(0.5)
+                if not self.wait(0.5):
+                    break
                 
-                # Remaining time: white cross in center
+                # Remaining time: white cross in center (static, drawn once)
                 if self.inter_sentence_interval > 0.5:
-                    cross_start = time.time()
-                    while time.time() - cross_start < (self.inter_sentence_interval - 0.5):
-                        for event in pygame.event.get():
-                            if event.type == pygame.QUIT:
-                                pygame.quit()
-                                return
-                            if event.type == pygame.KEYDOWN:
-                                if event.key == pygame.K_ESCAPE:
-                                    pygame.quit()
-                                    return
-                        
-                        self.screen.fill(self.BLACK)
-                        
-                        # Draw white cross in center
-                        cross_size = 40  # Size of cross arms
-                        cross_thickness = 10  # Thickness of cross lines
-                        center_x = self.width // 2
-                        center_y = self.height // 2
-                        
-                        # Horizontal line
-                        pygame.draw.rect(self.screen, self.WHITE,
-                                       (center_x - cross_size, center_y - cross_thickness // 2,
-                                        cross_size * 2, cross_thickness))
-                        # Vertical line
-                        pygame.draw.rect(self.screen, self.WHITE,
-                                       (center_x - cross_thickness // 2, center_y - cross_size,
-                                        cross_thickness, cross_size * 2))
-                        
-                        pygame.display.flip()
-                        self.clock.tick(60)
+                    self.draw_fixation_cross()
+                    pygame.display.flip()
+                    if not self.wait(self.inter_sentence_interval - 0.5):
+                        break
             
         finally: # Ensure pygame quits properly
+            _FONT_CACHE.clear() # Fonts are invalid once pygame quits
             pygame.quit() # Quit pygame
 
 # Example usage
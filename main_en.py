@@ -4,9 +4,101 @@ import time
 import random
 import csv
 import json
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 import os
 
+# Candidate Chinese/English fonts, tried in order
+CHINESE_FONTS = [
+    'C:/Windows/Fonts/msyh.ttc',     # Microsoft YaHei
+    'C:/Windows/Fonts/simhei.ttf',   # SimHei
+    'C:/Windows/Fonts/simsun.ttc',   # SimSun
+    'C:/Windows/Fonts/msyhbd.ttc',   # Microsoft YaHei Bold
+    '/usr/share/fonts/truetype/droid/DroidSansFallbackFull.ttf',
+    '/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc',
+    '/usr/share/fonts/truetype/wqy/wqy-zenhei.ttc',
+]
+
+
+@lru_cache(maxsize=None)
+def _resolve_font_path():
+    """Return the first installed font from CHINESE_FONTS, or None (resolved once per process)."""
+    for font_path in CHINESE_FONTS:
+        if os.path.isfile(font_path):
+            return font_path
+    return None
+
+
+def _read_lines(filename):
+    """Read a stimulus file in one pass and return its stripped, non-empty lines."""
+    lines = Path(filename).read_text(encoding='utf-8').splitlines()
+    return [line.strip() for line in lines if line.strip()]
+
+
+# The only event types the paradigms react to; everything else is blocked at
+# the SDL level so it is never queued
+_WANTED = (pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN)
+
+
+# Trial timestamps (seconds since experiment start) that are also saved as an
+# absolute ISO time in a '<field>_abs' column right after them
+_ABSOLUTE_FIELDS = frozenset({
+    'trial_start', 'trial_end',
+    'prep_onset', 'prep_offset', 'first_word_onset', 'sentence_complete',
+    'red_square_onset', 'green_square_onset', 'word_onset', 'word_offset',
+    'audio_onset', 'audio_offset',
+})
+
+
+# Whether raise_priority has already said it lacks the privileges to raise
+# the priority
+_PRIORITY_NOTE_SHOWN = False
+
+
+# Loaded fonts by font id (path, size), shared by all paradigms in the process;
+# the hashable id also keys the render cache below
+_FONT_CACHE = {}
+
+
+def _load_font(size):
+    """Load a suitable font at the given size, reusing an already loaded one.
+    
+    Returns (font_id, font).
+    """
+    # Try to load a Chinese/English font
+    font_path = _resolve_font_path()
+    if font_path is not None:
+        font_id = (font_path, size)
+        if font_id in _FONT_CACHE:
+            return font_id, _FONT_CACHE[font_id]
+        try:
+            font = pygame.font.Font(font_path, size)
+            print(f"Successfully loaded font: {font_path}")
+            _FONT_CACHE[font_id] = font
+            return font_id, font
+        except (OSError, pygame.error):
+            pass
+    
+    font_id = (None, size)
+    if font_id not in _FONT_CACHE:
+        print("Warning: Could not load system font. Using default font.")
+        _FONT_CACHE[font_id] = pygame.font.Font(None, size)
+    return font_id, _FONT_CACHE[font_id]
+
+
+@lru_cache(maxsize=4096)
+def _render_text(font_id, text, color):
+    """Render antialiased text with a loaded font, converted to the display format."""
+    return _FONT_CACHE[font_id].render(text, True, color).convert_alpha()
+
+
+@lru_cache(maxsize=8192)
+def _text_width(font_id, text):
+    """Width of text in a loaded font, measured without rasterizing."""
+    return _FONT_CACHE[font_id].size(text)[0]
+
 class BaseParadigm:
     """Base class for all experimental paradigms"""
     
@@ -24,11 +116,30 @@ class BaseParadigm:
         # Initialize pygame
         pygame.init()
         
-        # Set up display (fullscreen)
-        self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+        # Set up display (fullscreen). SCALED presents the frame through SDL2's
+        # GPU renderer as a texture; it needs an explicit size, so use the desktop's.
+        # vsync lets each presented frame wait for the display refresh.
+        info = pygame.display.Info()
+        size = (info.current_w, info.current_h)
+        try:
+            self.screen = pygame.display.set_mode(size, pygame.FULLSCREEN | pygame.SCALED, vsync=1)
+            self.vsync = True
+        except pygame.error:
+            print("Warning: vsync not available. Falling back to unsynchronized display.")
+            self.screen = pygame.display.set_mode(size, pygame.FULLSCREEN | pygame.SCALED)
+            self.vsync = False
+        # SDL can also ignore the vsync hint silently; ask where pygame can tell
+        is_vsync = getattr(pygame.display, 'is_vsync', None)
+        if is_vsync is not None:
+            self.vsync = bool(is_vsync())
         self.width, self.height = self.screen.get_size()
         pygame.display.set_caption(caption)
         
+        # Only queue the events we react to; fullscreen drivers can flood the
+        # queue with mouse motion otherwise
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(_WANTED)
+        
         # Colors
         self.BLACK = (0, 0, 0)
         self.WHITE = (255, 255, 255)
@@ -38,53 +149,125 @@ class BaseParadigm:
         
         # Font settings
         self.font_size = 80
-        self.font = self._load_font()
+        self._font_id, self.font = _load_font(self.font_size)
         
         # Square settings
         self.square_size = 40
         self.square_offset_y = 120  # Distance below text
+        self._square_x = self.width // 2 - self.square_size // 2
+        self._centered_square_pos = (self._square_x, self.height // 2 - self.square_size // 2)
+        self._centered_square_rect = pygame.Rect(self._centered_square_pos, (self.square_size, self.square_size))
         
-        # Clock for timing
+        # Clock for animation loops: they tick between polls that present nothing,
+        # and after presents when vsync is not pacing them. tick_busy_loop does
+        # not inherit SDL_Delay's coarse wake-up on some platforms
         self.clock = pygame.time.Clock()
         
         # Fixation cross settings
         self.cross_size = 40
         self.cross_thickness = 10
         
+        # Pre-rendered squares and fixation cross, blitted instead of drawn every frame
+        self._red_square = pygame.Surface((self.square_size, self.square_size))
+        self._red_square.fill(self.RED)
+        self._red_square = self._red_square.convert()
+        self._green_square = pygame.Surface((self.square_size, self.square_size))
+        self._green_square.fill(self.GREEN)
+        self._green_square = self._green_square.convert()
+        
+        self._cross = pygame.Surface((self.cross_size * 2, self.cross_size * 2))
+        self._cross.fill(self.BLACK)
+        pygame.draw.rect(self._cross, self.WHITE,
+                         (0, self.cross_size - self.cross_thickness // 2,
+                          self.cross_size * 2, self.cross_thickness))  # Horizontal line
+        pygame.draw.rect(self._cross, self.WHITE,
+                         (self.cross_size - self.cross_thickness // 2, 0,
+                          self.cross_thickness, self.cross_size * 2))  # Vertical line
+        self._cross = self._cross.convert()
+        self._cross_rect = self._cross.get_rect(center=(self.width // 2, self.height // 2))
+        
         # Timestamp recording
         self.experiment_start_time = time.perf_counter()
         self.experiment_start_datetime = datetime.now()
         self.experiment_start_datetime_iso = self.experiment_start_datetime.isoformat()
         self.trials_data = []
         self.output_prefix = output_prefix
+        self._output_stem = None   # timestamp/{prefix}_{time}, fixed at the first write
+        self._pending_trials = []  # recorded trials not yet written to the CSV file
+        self._csv_file = None      # opened when the first trial is written
+        self._csv_writer = None
+        
+        self._saved_priority = None  # scheduling priority to restore in cleanup
     
     def get_timestamp(self):
         """Get relative timestamp since experiment start."""
         return time.perf_counter() - self.experiment_start_time
     
-    def get_absolute_time(self):
-        """Get absolute timestamp (ISO format string)."""
-        return datetime.now().isoformat()
+    def to_absolute_time(self, timestamp):
+        """Convert a relative timestamp from get_timestamp to an absolute ISO time."""
+        return (self.experiment_start_datetime + timedelta(seconds=timestamp)).isoformat()
+    
+    def _output_path(self, extension):
+        """Path of an output file; all files of a run share one timestamped name."""
+        if self._output_stem is None:
+            # Create timestamp directory if it doesn't exist
+            timestamp_dir = "timestamp"
+            if not os.path.exists(timestamp_dir):
+                os.makedirs(timestamp_dir)
+                print(f"Created directory: {timestamp_dir}/")
+            
+            # Generate filename with timestamp
+            timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S")
+            self._output_stem = os.path.join(timestamp_dir, f"{self.output_prefix}_{timestamp_str}")
+        return f"{self._output_stem}.{extension}"
+    
+    def record_trial(self, trial_data):
+        """Keep a finished trial; it is written out by write_pending_trials.
+        
+        Nothing is formatted or written here, so the trial's last frame is not
+        held on screen longer than its recorded end.
+        """
+        self._pending_trials.append(trial_data)
+    
+    def write_pending_trials(self):
+        """Append recorded trials to the CSV file and sync it to disk.
+        
+        Absolute times are derived from the relative timestamps here, instead of
+        formatting datetimes during the timed phases. Syncing each row means
+        trials already run survive a crash.
+        """
+        if not self._pending_trials:
+            return
+        for trial_data in self._pending_trials:
+            row = {}
+            for key, value in trial_data.items():
+                row[key] = value
+                if key in _ABSOLUTE_FIELDS:
+                    row[f"{key}_abs"] = self.to_absolute_time(value)
+            
+            self.trials_data.append(row)
+            if self._csv_writer is None:
+                # Get all keys from first trial
+                self._csv_file = open(self._output_path("csv"), 'w', newline='', encoding='utf-8')
+                self._csv_writer = csv.DictWriter(self._csv_file, fieldnames=list(row.keys()))
+                self._csv_writer.writeheader()
+            self._csv_writer.writerow(row)
+        self._pending_trials.clear()
+        self._csv_file.flush()
+        os.fsync(self._csv_file.fileno())
     
     def save_data(self):
-        """Save collected data to CSV and JSON files."""
+        """Finish the CSV file and save collected data to a JSON file."""
+        self.write_pending_trials()
         if not self.trials_data:
             print("No data to save.")
             return
         
-        # Create timestamp directory if it doesn't exist
-        timestamp_dir = "timestamp"
-        if not os.path.exists(timestamp_dir):
-            os.makedirs(timestamp_dir)
-            print(f"Created directory: {timestamp_dir}/")
+        csv_filename = self._output_path("csv")
+        json_filename = self._output_path("json")
         
-        # Generate filename with timestamp
-        timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S")
-        csv_filename = os.path.join(timestamp_dir, f"{self.output_prefix}_{timestamp_str}.csv")
-        json_filename = os.path.join(timestamp_dir, f"{self.output_prefix}_{timestamp_str}.json")
-        
-        # Save CSV
-        self._save_csv(csv_filename)
+        # CSV rows were written during the intervals between trials
+        self._close_csv()
         
         # Save JSON
         self._save_json(json_filename)
@@ -93,18 +276,12 @@ class BaseParadigm:
         print(f"  CSV:  {csv_filename}")
         print(f"  JSON: {json_filename}")
     
-    def _save_csv(self, filename):
-        """Save data to CSV file."""
-        if not self.trials_data:
-            return
-        
-        # Get all keys from first trial
-        fieldnames = list(self.trials_data[0].keys())
-        
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(self.trials_data)
+    def _close_csv(self):
+        """Close the CSV file opened by record_trial."""
+        if self._csv_file is not None:
+            self._csv_file.close()
+            self._csv_file = None
+            self._csv_writer = None
     
     def _save_json(self, filename):
         """Save data to JSON file."""
@@ -117,112 +294,155 @@ class BaseParadigm:
         with open(filename, 'w', encoding='utf-8') as jsonfile:
             json.dump(data, jsonfile, indent=2, ensure_ascii=False)
     
-    def _load_font(self):
-        """Load a suitable font for the paradigm."""
-        # Try to load a Chinese/English font
-        chinese_fonts = [
-            'C:/Windows/Fonts/msyh.ttc',     # Microsoft YaHei
-            'C:/Windows/Fonts/simhei.ttf',   # SimHei
-            'C:/Windows/Fonts/simsun.ttc',   # SimSun
-            'C:/Windows/Fonts/msyhbd.ttc',   # Microsoft YaHei Bold
-            '/usr/share/fonts/truetype/droid/DroidSansFallbackFull.ttf',
-            '/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc',
-            '/usr/share/fonts/truetype/wqy/wqy-zenhei.ttc',
-        ]
-        
-        for font_path in chinese_fonts:
-            try:
-                font = pygame.font.Font(font_path, self.font_size)
-                print(f"Successfully loaded font: {font_path}")
-                return font
-            except:
-                continue
-        
-        print("Warning: Could not load system font. Using default font.")
-        return pygame.font.Font(None, self.font_size)
+    def render_text(self, text, color):
+        """Return the rendered Surface for text in the paradigm font (memoized across trials)."""
+        return _render_text(self._font_id, text, color)
+    
+    def text_width(self, text):
+        """Return the pixel width of text in the paradigm font (memoized across trials)."""
+        return _text_width(self._font_id, text)
     
     def draw_red_square(self, y_position):
         """Draw red square below the given y position."""
-        square_x = self.width // 2 - self.square_size // 2
-        square_y = y_position + self.square_offset_y
-        pygame.draw.rect(self.screen, self.RED, 
-                        (square_x, square_y, self.square_size, self.square_size))
+        self.screen.blit(self._red_square, (self._square_x, y_position + self.square_offset_y))
     
     def draw_green_square(self, y_position):
         """Draw green square below the given y position."""
-        square_x = self.width // 2 - self.square_size // 2
-        square_y = y_position + self.square_offset_y
-        pygame.draw.rect(self.screen, self.GREEN, 
-                        (square_x, square_y, self.square_size, self.square_size))
+        self.screen.blit(self._green_square, (self._square_x, y_position + self.square_offset_y))
     
     def draw_centered_red_square(self):
         """Draw red square in the center of screen."""
-        square_x = self.width // 2 - self.square_size // 2
-        square_y = self.height // 2 - self.square_size // 2
-        pygame.draw.rect(self.screen, self.RED, 
-                        (square_x, square_y, self.square_size, self.square_size))
+        self.screen.blit(self._red_square, self._centered_square_pos)
     
     def draw_centered_green_square(self):
         """Draw green square in the center of screen."""
-        square_x = self.width // 2 - self.square_size // 2
-        square_y = self.height // 2 - self.square_size // 2
-        pygame.draw.rect(self.screen, self.GREEN, 
-                        (square_x, square_y, self.square_size, self.square_size))
+        self.screen.blit(self._green_square, self._centered_square_pos)
     
     def draw_fixation_cross(self):
         """Draw white fixation cross in center of screen."""
-        center_x = self.width // 2
-        center_y = self.height // 2
-        
-        # Horizontal line
-        pygame.draw.rect(self.screen, self.WHITE,
-                       (center_x - self.cross_size, center_y - self.cross_thickness // 2,
-                        self.cross_size * 2, self.cross_thickness))
-        # Vertical line
-        pygame.draw.rect(self.screen, self.WHITE,
-                       (center_x - self.cross_thickness // 2, center_y - self.cross_size,
-                        self.cross_thickness, self.cross_size * 2))
+        self.screen.blit(self._cross, self._cross_rect)
+    
+    def is_exit_event(self, event):
+        """Return True if the event asks to end the experiment (QUIT, ESC, mouse click)."""
+        if event.type == pygame.QUIT:
+            return True
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                return True
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            print("Mouse clicked! Exiting...")
+            return True
+        return False
     
     def check_exit_events(self):
         """Check for exit events (QUIT, ESC, mouse click)."""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return False
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    return False
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                print("Mouse clicked! Exiting...")
+        # peek pumps the queue and answers without building an event list,
+        # which is the common case on nearly every frame
+        if not pygame.event.peek(_WANTED):
+            return True
+        for event in pygame.event.get(_WANTED):
+            if self.is_exit_event(event):
                 return False
         return True
     
-    def show_interval(self, interval_duration):
-        """Show inter-trial interval: black screen (0.5s) + fixation cross (remaining time)."""
+    def wait(self, duration):
+        """Keep the current frame on screen for duration seconds while polling exit events.
+        
+        Blocks in pygame.event.wait until an event arrives or the time is up,
+        instead of redrawing the same frame at 60 FPS.
+        Returns False if the user asked to quit.
+        """
+        deadline = pygame.time.get_ticks() + int(duration * 1000)
+        if not self.check_exit_events():
+            return False
+        while True:
+            remaining = deadline - pygame.time.get_ticks()
+            if remaining <= 0:
+                return True
+            event = pygame.event.wait(min(50, remaining))
+            if event.type != pygame.NOEVENT and self.is_exit_event(event):
+                return False
+    
+    def show_interval(self, interval_duration, background_task=None):
+        """Show inter-trial interval: black screen (0.5s) + fixation cross (remaining time).
+        
+        The previous trial is written to disk once the black screen is up, then
+        background_task, if given, is called (e.g. to prepare the next trial);
+        their run time counts towards the 0.5s.
+        """
         # First 0.5s: black screen
         self.screen.fill(self.BLACK)
         pygame.display.flip()
-        black_start = time.time()
-        while time.time() - black_start < 0.5:
-            if not self.check_exit_events():
-                return False
-            self.clock.tick(60)
+        black_start = pygame.time.get_ticks()
+        self.write_pending_trials()
+        if background_task is not None:
+            background_task()
+        if not self.wait(0.5 - (pygame.time.get_ticks() - black_start) / 1000.0):
+            return False
         
-        # Remaining time: white cross in center
+        # Remaining time: white cross in center (static, so drawn once). The
+        # screen is already black, so only the cross region is presented
         if interval_duration > 0.5:
-            cross_start = time.time()
-            while time.time() - cross_start < (interval_duration - 0.5):
-                if not self.check_exit_events():
-                    return False
-                
-                self.screen.fill(self.BLACK)
-                self.draw_fixation_cross()
-                pygame.display.flip()
-                self.clock.tick(60)
+            self.draw_fixation_cross()
+            pygame.display.update(self._cross_rect)
+            if not self.wait(interval_duration - 0.5):
+                return False
         
         return True
     
+    def raise_priority(self):
+        """Ask the OS to schedule this process ahead of normal ones (best effort).
+        
+        Uses a raised but not realtime priority: the animation loops poll with
+        tick_busy_loop, which could starve the compositor under SCHED_FIFO.
+        """
+        global _PRIORITY_NOTE_SHOWN
+        try:
+            if sys.platform == 'win32':
+                import ctypes
+                kernel32 = ctypes.windll.kernel32
+                process = kernel32.GetCurrentProcess()
+                self._saved_priority = kernel32.GetPriorityClass(process)
+                if not self._saved_priority:
+                    raise ctypes.WinError()
+                if not kernel32.SetPriorityClass(process, 0x00000080):  # HIGH_PRIORITY_CLASS
+                    raise ctypes.WinError()
+            else:
+                self._saved_priority = os.getpriority(os.PRIO_PROCESS, 0)
+                os.setpriority(os.PRIO_PROCESS, 0, -10)
+        except PermissionError:
+            # Expected without privileges (e.g. no CAP_SYS_NICE); mention it once per process
+            self._saved_priority = None
+            if not _PRIORITY_NOTE_SHOWN:
+                print("Note: running at normal process priority (raising it needs privileges).")
+                _PRIORITY_NOTE_SHOWN = True
+        except OSError as e:
+            self._saved_priority = None
+            print(f"Warning: could not raise process priority ({e}). Running at normal priority.")
+    
+    def restore_priority(self):
+        """Return to the priority the process had before raise_priority."""
+        if self._saved_priority is None:
+            return
+        try:
+            if sys.platform == 'win32':
+                import ctypes
+                kernel32 = ctypes.windll.kernel32
+                kernel32.SetPriorityClass(kernel32.GetCurrentProcess(), self._saved_priority)
+            else:
+                os.setpriority(os.PRIO_PROCESS, 0, self._saved_priority)
+        except OSError:
+            pass
+        self._saved_priority = None
+    
     def cleanup(self):
         """Clean up pygame resources."""
+        self.restore_priority()
+        
+        # Fonts and rendered surfaces do not survive pygame.quit()
+        _render_text.cache_clear()
+        _text_width.cache_clear()
+        _FONT_CACHE.clear()
         pygame.quit()
 
 
@@ -231,9 +451,13 @@ class SentenceParadigm(BaseParadigm):
                  prep_time=1.5, prep_time_jitter=0.1, jitter_mean=0.5, jitter_std=0.1, prep_mode='square', 
                  dot_interval=0.5, play_mode='green', 
                  progress_duration=1.2, progress_pause=0.5, inter_sentence_interval=2.0,
-                 output_prefix="sentence"):
+                 output_prefix="sentence", seed=None):
         """Initialize the sentence paradigm display."""
-        super().__init__(caption="Sentence Paradigm", output_prefix=output_prefix)
+        # Load sentences on a worker thread while pygame and the display initialize
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            sentences = pool.submit(_read_lines, sentences_file)
+            super().__init__(caption="Sentence Paradigm", output_prefix=output_prefix)
+            self.sentences = sentences.result()
         
         self.sentences_file = sentences_file
         self.char_speed = char_speed
@@ -247,9 +471,13 @@ class SentenceParadigm(BaseParadigm):
         self.progress_pause = progress_pause
         self.inter_sentence_interval = inter_sentence_interval
         
-        # Load sentences
-        with open(sentences_file, 'r', encoding='utf-8') as f:
-            self.sentences = [line.strip() for line in f if line.strip()]
+        # Sample the whole jitter schedule up front so a seed reproduces a session
+        self.seed = seed
+        rng = random.Random(seed)
+        self._prep_times = [rng.uniform(prep_time - prep_time_jitter, prep_time + prep_time_jitter)
+                            for _ in self.sentences]
+        self._jitters = [rng.uniform(jitter_mean - jitter_std, jitter_mean + jitter_std)
+                         for _ in self.sentences]
         
         # Spacing settings
         self.char_spacing = 15
@@ -258,23 +486,88 @@ class SentenceParadigm(BaseParadigm):
         self.dot_radius = 8
         self.dot_spacing = 40
         self.dot_interval = dot_interval
+        
+        # Sentence position and the band that holds everything drawn during a
+        # trial (text, progress bars, dots, square); the same for every sentence
+        self.sentence_y = self.height // 2 - 40
+        self._band = pygame.Rect(0, self.sentence_y - 20, self.width, int(self.font_size * 1.4) + 160)
+        
+        self._next_layout = None  # (sentence, layout) prepared during the previous interval
+        
+        # Pre-tokenize and pre-measure every sentence, and render its words up
+        # front, so starting a trial does no text work
+        self._prepared = {}
+        for sentence in self.sentences:
+            if sentence not in self._prepared:
+                self._prepared[sentence] = self.prepare_sentence(sentence)
+    
+    def prepare_sentence(self, sentence):
+        """Split a sentence into words, measure them and render them in the needed colors."""
+        words = sentence.split()
+        word_widths = [self.text_width(word) for word in words]
+        for word in words:
+            self.render_text(word, self.WHITE)
+            if self.play_mode == 'green':
+                self.render_text(word, self.GREEN)
+        return words, word_widths
     
-    def draw_dots(self, sentence_y, char_widths, num_dots_left, num_dots_right):
-        """Draw dots on both sides of the sentence."""
-        total_width = sum(char_widths) + self.char_spacing * 2 * (len(char_widths) - 1)
-        sentence_left = (self.width - total_width) // 2
-        sentence_right = sentence_left + total_width
-        dot_y = sentence_y + 35
+    def layout_sentence(self, sentence):
+        """Lay out a sentence and compose its white surface.
+        
+        Returns (words, word_widths, start_x, word_x_positions, sentence_surface).
+        """
+        prepared = self._prepared.get(sentence)
+        if prepared is None:
+            prepared = self.prepare_sentence(sentence)
+        words, word_widths = prepared
+        word_spacing = self.char_spacing * 2
+        
+        # Sentence layout is fixed for the whole trial
+        total_width = sum(word_widths) + word_spacing * (len(words) - 1)
+        start_x = (self.width - total_width) // 2
+        word_x_positions = []
+        current_x = start_x
+        for word_width in word_widths:
+            word_x_positions.append(current_x)
+            current_x += word_width + word_spacing
+        
+        # Compose the static white sentence once; it is blitted as a single surface
+        sentence_surface = pygame.Surface((max(total_width, 1), self.font.get_height()), pygame.SRCALPHA)
+        for i, word in enumerate(words):
+            sentence_surface.blit(self.render_text(word, self.WHITE), (word_x_positions[i] - start_x, 0))
+        sentence_surface = sentence_surface.convert_alpha(self.screen)
+        
+        return words, word_widths, start_x, word_x_positions, sentence_surface
+    
+    def prepare_next_layout(self, sentence):
+        """Lay out the upcoming sentence ahead of time (run during the inter-sentence interval)."""
+        self._next_layout = (sentence, self.layout_sentence(sentence))
+    
+    def draw_dots(self, dot_y, sentence_left, sentence_right, num_dots_left, num_dots_right):
+        """Draw dots on both sides of the sentence, given its precomputed boundaries."""
+        step = self.dot_radius * 2 + self.dot_spacing
         
         # Draw left dots
-        for i in range(num_dots_left):
-            dot_x = sentence_left - self.dot_spacing - (i * (self.dot_radius * 2 + self.dot_spacing))
+        dot_x = sentence_left - self.dot_spacing
+        for _ in range(num_dots_left):
             pygame.draw.circle(self.screen, self.WHITE, (dot_x, dot_y), self.dot_radius)
+            dot_x -= step
         
         # Draw right dots
-        for i in range(num_dots_right):
-            dot_x = sentence_right + self.dot_spacing + (i * (self.dot_radius * 2 + self.dot_spacing))
+        dot_x = sentence_right + self.dot_spacing
+        for _ in range(num_dots_right):
             pygame.draw.circle(self.screen, self.WHITE, (dot_x, dot_y), self.dot_radius)
+            dot_x += step
+    
+    def compose_band(self, band, blits, square=None, square_pos=None):
+        """Compose an opaque frame of the band: black background, the given
+        (surface, screen position) blits and optionally a square at square_pos."""
+        frame = pygame.Surface(band.size).convert()
+        frame.fill(self.BLACK)
+        frame.blits([(surf, (x - band.left, y - band.top)) for surf, (x, y) in blits], doreturn=False)
+        if square is not None:
+            frame.blit(square, (square_pos[0] - band.left, square_pos[1] - band.top))
+        return frame
     
     def display_sentence(self, sentence, trial_id):
         """Display a single sentence with the paradigm."""
@@ -285,194 +578,224 @@ class SentenceParadigm(BaseParadigm):
             'sentence': sentence,
             'prep_mode': self.prep_mode,
             'play_mode': self.play_mode,
-            'trial_start': self.get_timestamp(),
-            'trial_start_abs': self.get_absolute_time()
+            'trial_start': self.get_timestamp()
         }
         
-        sentence_y = self.height // 2 - 40
-        words = sentence.split()
-        word_spacing = self.char_spacing * 2
-        word_widths = [self.font.render(word, True, self.WHITE).get_width() for word in words]
+        sentence_y = self.sentence_y
+        idx = trial_id - 1  # trial ids are 1-based positions in self.sentences
+        
+        # Use the layout prepared during the previous interval when there is one
+        if self._next_layout is not None and self._next_layout[0] == sentence:
+            layout = self._next_layout[1]
+        else:
+            layout = self.layout_sentence(sentence)
+        self._next_layout = None
+        words, word_widths, start_x, word_x_positions, sentence_surface = layout
+        
+        # Everything drawn during the trial (text, progress bars, dots, square)
+        # lies in this horizontal band, which also covers the fixation cross,
+        # so only the band is cleared and presented each frame
+        dirty = self._band
+        sentence_blit = [(sentence_surface, (start_x, sentence_y - 20))]
+        square_pos = (self._square_x, sentence_y + self.square_offset_y)
         
         # Phase 1: Preparation phase
         trial_data['prep_onset'] = self.get_timestamp()
-        trial_data['prep_onset_abs'] = self.get_absolute_time()
         
         if self.prep_mode == 'square':
-            actual_prep_time = random.uniform(self.prep_time - self.prep_time_jitter,
-                                              self.prep_time + self.prep_time_jitter)
+            actual_prep_time = self._prep_times[idx]
             trial_data['actual_prep_time'] = actual_prep_time
             
-            start_time = time.time()
-            while time.time() - start_time < actual_prep_time:
-                if not self.check_exit_events():
-                    return False
-                
-                self.screen.fill(self.BLACK)
-                
-                # Draw white sentence
-                total_width = sum(word_widths) + word_spacing * (len(words) - 1)
-                start_x = (self.width - total_width) // 2
-                current_x = start_x
-                for i, word in enumerate(words):
-                    word_surface = self.font.render(word, True, self.WHITE)
-                    self.screen.blit(word_surface, (current_x, sentence_y - 20))
-                    current_x += word_widths[i] + word_spacing
-                
-                self.draw_red_square(sentence_y)
-                pygame.display.flip()
-                self.clock.tick(60)
+            # White sentence + red square, composed once for the phase
+            prep_frame = self.compose_band(dirty, sentence_blit, self._red_square, square_pos)
+            
+            self.screen.blit(prep_frame, dirty)
+            pygame.display.update(dirty)
+            
+            if not self.wait(actual_prep_time):
+                return False
         
         elif self.prep_mode == 'dots':
             total_dots = 3
             dots_left = total_dots
             dots_right = total_dots
-            start_time = time.time()
-            last_dot_time = start_time
+            dot_interval_ms = int(round(self.dot_interval * 1000))
+            next_dot_ticks = pygame.time.get_ticks() + dot_interval_ms
+            
+            # Sentence boundaries are fixed for the phase
+            dot_y = sentence_y + 35
+            sentence_left = start_x
+            sentence_right = word_x_positions[-1] + word_widths[-1]
+            
+            # Draw the sentence and all dots once; afterwards only removed dots are erased
+            self.screen.blit(self.compose_band(dirty, sentence_blit), dirty)
+            self.draw_dots(dot_y, sentence_left, sentence_right, dots_left, dots_right)
+            pygame.display.update(dirty)
+            step = self.dot_radius * 2 + self.dot_spacing
+            dot_box = self.dot_radius * 2 + 2
             
             while dots_left > 0 or dots_right > 0:
-                if not self.check_exit_events():
+                # Nothing changes until the next dot is due, so block until then
+                if not self.wait((next_dot_ticks - pygame.time.get_ticks()) / 1000.0):
                     return False
+                next_dot_ticks += dot_interval_ms
                 
-                current_time = time.time()
-                if current_time - last_dot_time >= self.dot_interval:
-                    if dots_left > 0:
-                        dots_left -= 1
-                    if dots_right > 0:
-                        dots_right -= 1
-                    last_dot_time = current_time
-                
-                self.screen.fill(self.BLACK)
-                
-                # Draw white sentence
-                total_width = sum(word_widths) + word_spacing * (len(words) - 1)
-                start_x = (self.width - total_width) // 2
-                current_x = start_x
-                for i, word in enumerate(words):
-                    word_surface = self.font.render(word, True, self.WHITE)
-                    self.screen.blit(word_surface, (current_x, sentence_y - 20))
-                    current_x += word_widths[i] + word_spacing
+                # Erase the outermost remaining dot on each side
+                removed = []
+                if dots_left > 0:
+                    dots_left -= 1
+                    dot_x = sentence_left - self.dot_spacing - dots_left * step
+                    removed.append(pygame.Rect(0, 0, dot_box, dot_box))
+                    removed[-1].center = (dot_x, dot_y)
+                if dots_right > 0:
+                    dots_right -= 1
+                    dot_x = sentence_right + self.dot_spacing + dots_right * step
+                    removed.append(pygame.Rect(0, 0, dot_box, dot_box))
+                    removed[-1].center = (dot_x, dot_y)
                 
-                self.draw_dots(sentence_y, word_widths, dots_left, dots_right)
-                pygame.display.flip()
-                self.clock.tick(60)
+                for rect in removed:
+                    self.screen.fill(self.BLACK, rect)
+                pygame.display.update(removed)
         
         trial_data['prep_offset'] = self.get_timestamp()
-        trial_data['prep_offset_abs'] = self.get_absolute_time()
         
         # Phase 2: Word display animation
         trial_data['first_word_onset'] = self.get_timestamp()
-        trial_data['first_word_onset_abs'] = self.get_absolute_time()
         
         if self.play_mode == 'green':
             green_count = 0
-            start_time = time.time()
-            jitter = random.uniform(self.jitter_mean - self.jitter_std, 
-                                    self.jitter_mean + self.jitter_std)
+            start_ticks = pygame.time.get_ticks()
+            jitter = self._jitters[idx]
             trial_data['actual_jitter'] = jitter
+            last_green_count = -1
             
-            while green_count <= len(words):
+            # Integer millisecond timings so the frame loop does no float work
+            jitter_ms = int(round(jitter * 1000))
+            word_ms = max(1, int(round(self.char_speed * 1000)))
+            n_words = len(words)
+            
+            # Blit sequences for each color; a frame takes the first green_count
+            # entries from the green one and the rest from the white one
+            white_blits = [(self.render_text(word, self.WHITE), (word_x_positions[i], sentence_y - 20))
+                           for i, word in enumerate(words)]
+            green_blits = [(self.render_text(word, self.GREEN), (word_x_positions[i], sentence_y - 20))
+                           for i, word in enumerate(words)]
+            
+            green_square = self._green_square if self.prep_mode == 'square' else None
+            word_rects = [pygame.Rect(x, sentence_y - 20, width, self.font.get_height())
+                          for x, width in zip(word_x_positions, word_widths)]
+            
+            while green_count <= n_words:
                 if not self.check_exit_events():
                     return False
                 
-                elapsed = time.time() - start_time
-                if elapsed < jitter:
+                elapsed_ms = pygame.time.get_ticks() - start_ticks
+                if elapsed_ms < jitter_ms:
                     green_count = 0
                 else:
-                    green_count = int((elapsed - jitter) / self.char_speed) + 1
-                
-                if green_count > len(words):
-                    green_count = len(words)
+                    green_count = (elapsed_ms - jitter_ms) // word_ms + 1
                 
-                self.screen.fill(self.BLACK)
+                if green_count > n_words:
+                    green_count = n_words
                 
-                total_width = sum(word_widths) + word_spacing * (len(words) - 1)
-                start_x = (self.width - total_width) // 2
-                current_x = start_x
-                for i, word in enumerate(words):
-                    color = self.GREEN if i < green_count else self.WHITE
-                    word_surface = self.font.render(word, True, color)
-                    self.screen.blit(word_surface, (current_x, sentence_y - 20))
-                    current_x += word_widths[i] + word_spacing
+                # Redraw only when another word has turned green
+                if green_count != last_green_count:
+                    if last_green_count < 0:
+                        # First frame of the phase: present the whole band
+                        frame = self.compose_band(dirty, green_blits[:green_count] + white_blits[green_count:],
+                                                  green_square, square_pos)
+                        self.screen.blit(frame, dirty)
+                        pygame.display.update(dirty)
+                    else:
+                        # Repaint and present only the words that just turned green
+                        changed = word_rects[last_green_count:green_count]
+                        for rect, (surf, pos) in zip(changed, green_blits[last_green_count:green_count]):
+                            self.screen.fill(self.BLACK, rect)
+                            self.screen.blit(surf, pos)
+                        pygame.display.update(changed)
+                    last_green_count = green_count
                 
-                if self.prep_mode == 'square':
-                    self.draw_green_square(sentence_y)
+                self.clock.tick_busy_loop(60)
                 
-                pygame.display.flip()
-                self.clock.tick(60)
-                
-                if green_count >= len(words):
+                if green_count >= n_words:
                     break
         
         elif self.play_mode == 'progress':
-            total_width = sum(word_widths) + word_spacing * (len(words) - 1)
-            start_x = (self.width - total_width) // 2
-            completed_bars = []
+            progress_bar_y = sentence_y - 20
+            bar_height = int(self.font_size * 1.4)
+            progress_ms = max(1, int(round(self.progress_duration * 1000)))
+            
+            # Completed progress bars are painted once into a band-sized overlay
+            # (black background and, in square mode, the green square included),
+            # which also clears the band each frame
+            green_square = self._green_square if self.prep_mode == 'square' else None
+            bars_surface = self.compose_band(dirty, [], green_square, square_pos)
+            
+            # Present the whole band once; afterwards only the current word's column changes
+            self.screen.blit(bars_surface, dirty)
+            self.screen.blit(sentence_surface, (start_x, sentence_y - 20))
+            pygame.display.update(dirty)
+            column_height = max(bar_height, self.font.get_height())
             
             for word_idx in range(len(words)):
-                word_x = start_x + sum(word_widths[:word_idx]) + word_spacing * word_idx
+                word_x = word_x_positions[word_idx]
                 word_width = word_widths[word_idx]
+                column = pygame.Rect(word_x, progress_bar_y, word_width, column_height)
+                prev_pixels = 0
                 
-                start_time = time.time()
-                while time.time() - start_time < self.progress_duration:
+                start_ticks = pygame.time.get_ticks()
+                while True:
                     if not self.check_exit_events():
                         return False
                     
-                    elapsed = time.time() - start_time
-                    progress = min(1.0, elapsed / self.progress_duration)
-                    
-                    self.screen.fill(self.BLACK)
-                    progress_bar_y = sentence_y - 20
-                    
-                    # Draw completed progress bars
-                    for _, completed_x, completed_width in completed_bars:
-                        pygame.draw.rect(self.screen, self.LIGHT_BROWN,
-                                       (completed_x, progress_bar_y, completed_width, int(self.font_size * 1.4)))
+                    elapsed_ms = pygame.time.get_ticks() - start_ticks
+                    if elapsed_ms >= progress_ms:
+                        break
                     
-                    # Draw current progress bar
-                    progress_bar_width = int(word_width * progress)
-                    pygame.draw.rect(self.screen, self.LIGHT_BROWN,
-                                   (word_x, progress_bar_y, progress_bar_width, int(self.font_size * 1.4)))
+                    # The bar only grows, so only the newly covered strip is redrawn
+                    new_pixels = word_width * elapsed_ms // progress_ms
+                    if new_pixels <= prev_pixels:
+                        self.clock.tick_busy_loop(60) # Nothing to present this frame
+                        continue
+                    delta = pygame.Rect(word_x + prev_pixels, progress_bar_y,
+                                        new_pixels - prev_pixels, column_height)
                     
-                    # Draw all words on top
-                    current_x = start_x
-                    for i, word in enumerate(words):
-                        word_surface = self.font.render(word, True, self.WHITE)
-                        self.screen.blit(word_surface, (current_x, sentence_y - 20))
-                        current_x += word_widths[i] + word_spacing
+                    self.screen.set_clip(delta)
+                    self.screen.blit(bars_surface, dirty) # Restore the background under the text
+                    self.screen.fill(self.LIGHT_BROWN, (delta.x, progress_bar_y, delta.width, bar_height))
+                    self.screen.blit(sentence_surface, (start_x, sentence_y - 20)) # Word on top
+                    self.screen.set_clip(None)
                     
-                    if self.prep_mode == 'square':
-                        self.draw_green_square(sentence_y)
-                    
-                    pygame.display.flip()
-                    self.clock.tick(60)
+                    pygame.display.update(delta) # Paced by vsync when it was granted
+                    if not self.vsync:
+                        self.clock.tick_busy_loop(60)
+                    prev_pixels = new_pixels
                 
-                completed_bars.append((word_idx, word_x, int(word_width * 0.99)))
+                # Add completed progress bar to the overlay and show it in its final width
+                pygame.draw.rect(bars_surface, self.LIGHT_BROWN,
+                                 (word_x, progress_bar_y - dirty.top, int(word_width * 0.99), bar_height))
+                self.screen.set_clip(column)
+                self.screen.blit(bars_surface, dirty)
+                self.screen.blit(sentence_surface, (start_x, sentence_y - 20))
+                self.screen.set_clip(None)
+                pygame.display.update(column)
                 
                 # Pause between words
                 if word_idx < len(words) - 1:
-                    pause_start = time.time()
-                    while time.time() - pause_start < self.progress_pause:
-                        if not self.check_exit_events():
-                            return False
-                        self.clock.tick(60)
+                    if not self.wait(self.progress_pause):
+                        return False
         
         trial_data['sentence_complete'] = self.get_timestamp()
-        trial_data['sentence_complete_abs'] = self.get_absolute_time()
         
         # Hold final state
-        hold_start = time.time()
-        while time.time() - hold_start < 0.5:
-            if not self.check_exit_events():
-                return False
-            self.clock.tick(60)
+        if not self.wait(0.5):
+            return False
         
         trial_data['trial_end'] = self.get_timestamp()
-        trial_data['trial_end_abs'] = self.get_absolute_time()
         trial_data['word_count'] = len(words)
         
         # Save trial data
-        self.trials_data.append(trial_data)
+        self.record_trial(trial_data)
         
         return True
     
@@ -483,6 +806,7 @@ class SentenceParadigm(BaseParadigm):
         print(f"Character speed: {self.char_speed} s/char")
         print(f"Preparation time: {self.prep_time} s")
         
+        self.raise_priority()
         try:
             for i, sentence in enumerate(self.sentences):
                 print(f"Displaying sentence {i+1}/{len(self.sentences)}: {sentence}")
@@ -490,7 +814,13 @@ class SentenceParadigm(BaseParadigm):
                 if not self.display_sentence(sentence, trial_id=i+1):
                     break
                 
-                if not self.show_interval(self.inter_sentence_interval):
+                # Lay out the next sentence while the interval's black screen is up
+                next_task = None
+                if i + 1 < len(self.sentences):
+                    next_sentence = self.sentences[i + 1]
+                    next_task = lambda: self.prepare_next_layout(next_sentence)
+                
+                if not self.show_interval(self.inter_sentence_interval, background_task=next_task):
                     break
         
         finally:
@@ -501,9 +831,13 @@ class SentenceParadigm(BaseParadigm):
 class ReadingParadigm(BaseParadigm):
     def __init__(self, words_file, word_duration=0.3, prep_time=1.5, prep_time_jitter=0.1, 
                  word_jitter_mean=0.5, word_jitter_std=0.1, inter_word_interval=2.0,
-                 output_prefix="reading"):
+                 output_prefix="reading", seed=None):
         """Initialize the reading paradigm display."""
-        super().__init__(caption="Reading Paradigm", output_prefix=output_prefix)
+        # Load words on a worker thread while pygame and the display initialize
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            words = pool.submit(_read_lines, words_file)
+            super().__init__(caption="Reading Paradigm", output_prefix=output_prefix)
+            self.words = words.result()
         
         self.words_file = words_file
         self.word_duration = word_duration
@@ -513,9 +847,21 @@ class ReadingParadigm(BaseParadigm):
         self.word_jitter_std = word_jitter_std
         self.inter_word_interval = inter_word_interval
         
-        # Load words
-        with open(words_file, 'r', encoding='utf-8') as f:
-            self.words = [line.strip() for line in f if line.strip()]
+        # Sample the whole jitter schedule up front so a seed reproduces a session
+        self.seed = seed
+        rng = random.Random(seed)
+        self._prep_times = [rng.uniform(prep_time - prep_time_jitter, prep_time + prep_time_jitter)
+                            for _ in self.words]
+        self._word_jitters = [rng.uniform(word_jitter_mean - word_jitter_std, word_jitter_mean + word_jitter_std)
+                              for _ in self.words]
+        
+        # Render and center every word up front, so starting a trial does no text work
+        self._word_surfaces = {}
+        for word in self.words:
+            if word not in self._word_surfaces:
+                word_surface = self.render_text(word, self.WHITE)
+                self._word_surfaces[word] = (word_surface,
+                                             word_surface.get_rect(center=(self.width // 2, self.height // 2)))
     
     def display_word(self, word, trial_id):
         """Display a single word with the paradigm."""
@@ -524,72 +870,55 @@ class ReadingParadigm(BaseParadigm):
             'trial_id': trial_id,
             'paradigm': 'reading',
             'word': word,
-            'trial_start': self.get_timestamp(),
-            'trial_start_abs': self.get_absolute_time()  # 添加绝对时间
+            'trial_start': self.get_timestamp()
         }
         
-        actual_prep_time = random.uniform(self.prep_time - self.prep_time_jitter,
-                                          self.prep_time + self.prep_time_jitter)
-        word_jitter = random.uniform(self.word_jitter_mean - self.word_jitter_std,
-                                     self.word_jitter_mean + self.word_jitter_std)
+        idx = trial_id - 1  # trial ids are 1-based positions in self.words
+        actual_prep_time = self._prep_times[idx]
+        word_jitter = self._word_jitters[idx]
         
         trial_data['actual_prep_time'] = actual_prep_time
         trial_data['actual_word_jitter'] = word_jitter
         
+        word_surface, word_rect = self._word_surfaces[word]
+        
         # Phase 1: Red square in center
         trial_data['red_square_onset'] = self.get_timestamp()
-        trial_data['red_square_onset_abs'] = self.get_absolute_time()
         
-        start_time = time.time()
-        while time.time() - start_time < actual_prep_time:
-            if not self.check_exit_events():
-                return False
-            
-            self.screen.fill(self.BLACK)
-            self.draw_centered_red_square()
-            pygame.display.flip()
-            self.clock.tick(60)
+        # Full clear once per trial; later phases only touch what changes
+        self.screen.fill(self.BLACK)
+        self.draw_centered_red_square()
+        pygame.display.flip()
+        
+        if not self.wait(actual_prep_time):
+            return False
         
         # Phase 2: Green square in center with jitter delay
         trial_data['green_square_onset'] = self.get_timestamp()
-        trial_data['green_square_onset_abs'] = self.get_absolute_time()
         
-        start_time = time.time()
-        while time.time() - start_time < word_jitter:
-            if not self.check_exit_events():
-                return False
-            
-            self.screen.fill(self.BLACK)
-            self.draw_centered_green_square()
-            pygame.display.flip()
-            self.clock.tick(60)
+        # The green square covers the red one exactly
+        self.draw_centered_green_square()
+        pygame.display.update(self._centered_square_rect)
+        
+        if not self.wait(word_jitter):
+            return False
         
         # Phase 3: Word only (no square) in center
         trial_data['word_onset'] = self.get_timestamp()
-        trial_data['word_onset_abs'] = self.get_absolute_time()
         
-        start_time = time.time()
-        while time.time() - start_time < self.word_duration:
-            if not self.check_exit_events():
-                return False
-            
-            self.screen.fill(self.BLACK)
-            
-            # Render and center the word
-            word_surface = self.font.render(word, True, self.WHITE)
-            word_rect = word_surface.get_rect(center=(self.width // 2, self.height // 2))
-            self.screen.blit(word_surface, word_rect)
-            
-            pygame.display.flip()
-            self.clock.tick(60)
+        # Erase the square and draw the word
+        self.screen.fill(self.BLACK, self._centered_square_rect)
+        self.screen.blit(word_surface, word_rect)
+        pygame.display.update([self._centered_square_rect, word_rect])
+        
+        if not self.wait(self.word_duration):
+            return False
         
         trial_data['word_offset'] = self.get_timestamp()
-        trial_data['word_offset_abs'] = self.get_absolute_time()
         trial_data['trial_end'] = self.get_timestamp()
-        trial_data['trial_end_abs'] = self.get_absolute_time()
         
         # Save trial data
-        self.trials_data.append(trial_data)
+        self.record_trial(trial_data)
         
         return True
     
@@ -600,6 +929,7 @@ class ReadingParadigm(BaseParadigm):
         print(f"Word duration: {self.word_duration} s")
         print(f"Preparation time: {self.prep_time} s")
         
+        self.raise_priority()
         try:
             for i, word in enumerate(self.words):
                 print(f"Displaying word {i+1}/{len(self.words)}: {word}")
@@ -619,8 +949,17 @@ class ListeningParadigm(BaseParadigm):
     def __init__(self, audios_folder="audios", prep_time=1.5, prep_time_jitter=0.1, 
                  audio_jitter_mean=0.5, audio_jitter_std=0.1,
                  inter_audio_interval=2.0, repetitions=3,
-                 output_prefix="listening"):
-        """Initialize the listening paradigm display."""
+                 output_prefix="listening", seed=None, preload=True, audio_buffer=512):
+        """Initialize the listening paradigm display.
+        
+        With preload=False audio files are streamed from disk on each trial
+        instead of being decoded into memory up front (for large corpora).
+        audio_buffer is the mixer buffer in sample frames; raise it if the
+        audio crackles on slow hardware.
+        """
+        # A small mixer buffer keeps the delay between play() and audible onset
+        # short and steady; must be set before pygame.init() opens the mixer
+        pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=audio_buffer)
         super().__init__(caption="Listening Paradigm", output_prefix=output_prefix)
         
         self.audios_folder = audios_folder
@@ -630,109 +969,142 @@ class ListeningParadigm(BaseParadigm):
         self.audio_jitter_std = audio_jitter_std
         self.inter_audio_interval = inter_audio_interval
         self.repetitions = repetitions
+        self.preload = preload
         
         # Initialize mixer
         pygame.mixer.init()
-        
-        # Load audio files
-        import glob
-        audio_extensions = ['*.mp3', '*.wav', '*.ogg']
-        self.audio_files = []
-        for ext in audio_extensions:
-            self.audio_files.extend(glob.glob(os.path.join(audios_folder, ext)))
+        # get_init reports the opened format, but not the buffer size
+        frequency, sample_format, channels = pygame.mixer.get_init()
+        print(f"Audio mixer: {frequency} Hz, format {sample_format}, {channels} channels "
+              f"(requested buffer {audio_buffer} frames)")
+        
+        # Posted by the mixer when a sound finishes, so playback can be waited
+        # on instead of polled; it has to get past the event filter
+        self._audio_end = pygame.event.custom_type()
+        pygame.event.set_allowed(self._audio_end)
+        pygame.mixer.music.set_endevent(self._audio_end)
+        
+        # Stimuli play on one reserved channel, so nothing else can take it
+        self._channel = pygame.mixer.Channel(0)
+        pygame.mixer.set_reserved(1)
+        self._channel.set_endevent(self._audio_end)
+        
+        # Load audio files in one directory pass, sorted so a seed gives the
+        # same playlist on every machine
+        audio_extensions = ('.mp3', '.wav', '.ogg')
+        try:
+            with os.scandir(audios_folder) as entries:
+                self.audio_files = sorted(entry.path for entry in entries
+                                          if entry.is_file() and entry.name.lower().endswith(audio_extensions))
+        except FileNotFoundError:
+            self.audio_files = []
         
         if not self.audio_files:
             raise ValueError(f"No audio files found in {audios_folder}")
         
-        print(f"Found {len(self.audio_files)} audio files: {[os.path.basename(f) for f in self.audio_files]}")
+        # File names for logging, computed once per file rather than per trial
+        self._filenames = {audio_file: os.path.basename(audio_file) for audio_file in self.audio_files}
+        print(f"Found {len(self.audio_files)} audio files: {[self._filenames[f] for f in self.audio_files]}")
+        
+        # Decode every file once, so repetitions do not reopen and re-decode it;
+        # files Sound cannot load (None) are streamed with mixer.music instead
+        self._sounds = dict.fromkeys(self.audio_files)
+        if preload:
+            for audio_file in self.audio_files:
+                try:
+                    self._sounds[audio_file] = pygame.mixer.Sound(audio_file)
+                except pygame.error as e:
+                    print(f"Warning: could not preload {self._filenames[audio_file]} ({e}). It will be streamed.")
         
         # Create randomized playlist
         self.playlist = []
         for audio_file in self.audio_files:
             self.playlist.extend([audio_file] * self.repetitions)
         
-        random.shuffle(self.playlist)
+        # Shuffle and sample the whole jitter schedule up front so a seed reproduces a session
+        self.seed = seed
+        rng = random.Random(seed)
+        rng.shuffle(self.playlist)
         print(f"Created playlist with {len(self.playlist)} items (random order)")
+        self._prep_times = [rng.uniform(prep_time - prep_time_jitter, prep_time + prep_time_jitter)
+                            for _ in self.playlist]
+        self._audio_jitters = [rng.uniform(audio_jitter_mean - audio_jitter_std, audio_jitter_mean + audio_jitter_std)
+                               for _ in self.playlist]
     
     def play_audio(self, audio_file, trial_id):
         """Play a single audio file with the paradigm."""
-        filename = os.path.basename(audio_file)
+        filename = self._filenames[audio_file]
         
         # Initialize trial data
         trial_data = {
             'trial_id': trial_id,
             'paradigm': 'listening',
             'audio_filename': filename,
-            'trial_start': self.get_timestamp(),
-            'trial_start_abs': self.get_absolute_time()
+            'trial_start': self.get_timestamp()
         }
         
-        actual_prep_time = random.uniform(self.prep_time - self.prep_time_jitter,
-                                          self.prep_time + self.prep_time_jitter)
-        audio_jitter = random.uniform(self.audio_jitter_mean - self.audio_jitter_std,
-                                     self.audio_jitter_mean + self.audio_jitter_std)
+        idx = trial_id - 1  # trial ids are 1-based positions in self.playlist
+        actual_prep_time = self._prep_times[idx]
+        audio_jitter = self._audio_jitters[idx]
         
         trial_data['actual_prep_time'] = actual_prep_time
         trial_data['actual_audio_jitter'] = audio_jitter
         
         # Phase 1: Red square in center
         trial_data['red_square_onset'] = self.get_timestamp()
-        trial_data['red_square_onset_abs'] = self.get_absolute_time()
         
-        start_time = time.time()
-        while time.time() - start_time < actual_prep_time:
-            if not self.check_exit_events():
-                return False
-            
-            self.screen.fill(self.BLACK)
-            self.draw_centered_red_square()  # 改用居中方块
-            pygame.display.flip()
-            self.clock.tick(60)
+        # Full clear once per trial; later phases only touch what changes
+        self.screen.fill(self.BLACK)
+        self.draw_centered_red_square()  # 改用居中方块
+        pygame.display.flip()
+        
+        if not self.wait(actual_prep_time):
+            return False
         
         # Phase 2: Green square in center with jitter delay
         trial_data['green_square_onset'] = self.get_timestamp()
-        trial_data['green_square_onset_abs'] = self.get_absolute_time()
         
-        start_time = time.time()
-        while time.time() - start_time < audio_jitter:
-            if not self.check_exit_events():
-                return False
-            
-            self.screen.fill(self.BLACK)
-            self.draw_centered_green_square()  # 改用居中方块
-            pygame.display.flip()
-            self.clock.tick(60)
+        # The green square covers the red one exactly
+        self.draw_centered_green_square()  # 改用居中方块
+        pygame.display.update(self._centered_square_rect)
+        
+        if not self.wait(audio_jitter):
+            return False
         
         # Phase 3: Play audio with green square in center
         trial_data['audio_onset'] = self.get_timestamp()
-        trial_data['audio_onset_abs'] = self.get_absolute_time()
         
         try:
-            pygame.mixer.music.load(audio_file)
-            pygame.mixer.music.play()
+            sound = self._sounds[audio_file]
+            pygame.event.clear(self._audio_end)
+            if sound is not None:
+                self._channel.play(sound)
+                is_playing, stop = self._channel.get_busy, self._channel.stop
+            else:
+                pygame.mixer.music.load(audio_file)
+                pygame.mixer.music.play()
+                is_playing, stop = pygame.mixer.music.get_busy, pygame.mixer.music.stop
             
-            while pygame.mixer.music.get_busy():
-                if not self.check_exit_events():
-                    pygame.mixer.music.stop()
+            # The green square stays on screen unchanged while the audio plays;
+            # sleep until the end event (get_busy is a fallback) or an exit event
+            while is_playing():
+                event = pygame.event.wait(100)
+                if event.type == self._audio_end:
+                    break
+                if event.type != pygame.NOEVENT and self.is_exit_event(event):
+                    stop()
                     return False
-                
-                self.screen.fill(self.BLACK)
-                self.draw_centered_green_square()  # 改用居中方块
-                pygame.display.flip()
-                self.clock.tick(60)
             
             trial_data['audio_offset'] = self.get_timestamp()
-            trial_data['audio_offset_abs'] = self.get_absolute_time()
     
         except Exception as e:
             print(f"Error playing audio {audio_file}: {e}")
             return False
         
         trial_data['trial_end'] = self.get_timestamp()
-        trial_data['trial_end_abs'] = self.get_absolute_time()
         
         # Save trial data
-        self.trials_data.append(trial_data)
+        self.record_trial(trial_data)
         
         return True
     
@@ -742,9 +1114,10 @@ class ListeningParadigm(BaseParadigm):
         print("Press ESC or click mouse to quit")
         print(f"Preparation time: {self.prep_time} s")
         
+        self.raise_priority()
         try:
             for i, audio_file in enumerate(self.playlist):
-                filename = os.path.basename(audio_file)
+                filename = self._filenames[audio_file]
                 print(f"Playing audio {i+1}/{len(self.playlist)}: {filename}")
                 
                 if not self.play_audio(audio_file, trial_id=i+1):